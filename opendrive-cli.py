@@ -1,17 +1,19 @@
 import argparse
-import configparser
 import os.path
 import sys
-from opendrivecli.opendriveclient import OpenDriveClient
 
 # Global vars
 homedir = os.path.expanduser("~")
-cfgfile = homedir + "/.odcli"
-if not os.path.isfile(cfgfile):
-    cfgfile = "/etc/opendrive-cli.conf"
-    if not os.path.isfile(cfgfile):
-        cfgfile = None
+cfgfile = None
+for candidate in (homedir + "/.odcli", "/etc/opendrive-cli.conf"):
+    try:
+        os.stat(candidate)
+    except FileNotFoundError:
+        continue
+    cfgfile = candidate
+    break
 if cfgfile:
+    import configparser
     config = configparser.ConfigParser()
     config.read(cfgfile)
 else:
@@ -54,5 +56,7 @@ if not username or not password:
     sys.stderr.write("[ERROR] Username or password not set" + os.linesep)
     sys.exit(1)
 
+from opendrivecli.opendriveclient import OpenDriveClient
+
 od = OpenDriveClient(args, username, password)
 od.run()
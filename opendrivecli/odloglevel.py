@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class ODLogLevel(Enum):
+class ODLogLevel(IntEnum):
     ERROR = 0
     WARN = 1
     INFO = 2
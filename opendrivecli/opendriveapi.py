@@ -1,50 +1,153 @@
 import sys
 import os
 import json
+import time
+import functools
+import http.client
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import hashlib
 from hashlib import md5
-import urllib.request
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    _TRANSPORT_ERRORS = (requests.RequestException,)
+except ImportError:
+    # Fall back to keep-alive http.client connections, see __fallback_request
+    requests = None
+    _TRANSPORT_ERRORS = (OSError, http.client.HTTPException)
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+try:
+    # orjson decodes bytes directly and is considerably faster
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 from opendrivecli.odloglevel import ODLogLevel
 from opendrivecli.odaccessperm import ODAccessPerm
 
+# Log line prefixes, indexed by ODLogLevel value
+_PREFIX = ("[ERROR] ", "[WARN] ", "[INFO] ", "[DEBUG] ")
+
+
+class _HTTPResponse:
+    """
+    Minimal response object for the http.client fallback transport,
+    matching the status_code/content attributes used from requests
+    """
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+
+def _stream_and_hash(path, hasher, bufsize=1 << 20):
+    """
+    Yield a file in bufsize chunks while feeding them to hasher
+    :param path: Filename and -path
+    :param hasher: Hash object updated with every chunk
+    :param bufsize: Chunk size in bytes
+
+    Passing the generator as a request body streams the upload with at most
+    bufsize bytes in memory and computes the checksum in the same disk pass,
+    so the file is read exactly once. Read hasher.hexdigest() only after the
+    stream has been fully consumed.
+    """
+    with open(path, "rb") as f:
+        while chunk := f.read(bufsize):
+            hasher.update(chunk)
+            yield chunk
+
 
 class OpenDriveAPI:
     """
     OpenDrive API Class
     """
     BASEURL = "https://dev.opendrive.com/api/v1/"
+    _URL_LOGIN = BASEURL + "session/login.json"
+    _URL_LOGOUT = BASEURL + "session/logout.json"
+    _URL_EXISTS = BASEURL + "session/exists.json"
+    _URL_TRASH = BASEURL + "file/trash.json"
+    _URL_RESTORE = BASEURL + "file/restore.json"
+    _URL_SENDBYEMAIL = BASEURL + "file/sendbyemail.json"
+    _URL_RENAME = BASEURL + "file/rename.json"
+    _URL_MOVECOPY = BASEURL + "file/move_copy.json"
+    _URL_IDBYPATH = BASEURL + "file/idbypath.json"
+    _URL_ACCESS = BASEURL + "file/access.json"
     ACCESS_PRIVATE = 0
     ACCESS_PUBLIC = 1
     ACCESS_HIDDEN = 2
+    SESSION_TTL = 300
+    MAX_PARALLEL = 8
+    NEG_CACHE_SIZE = 512
 
     def __init__(self, loglevel):
         self.__sessionId = None
+        self.__session_fragment = None
+        self.__session_verified_at = None
         self.__loglevel = loglevel
+        # Per-instance LRU over path lookups, cleared on login/logout and
+        # on any mutating file operation
+        self.__idbypath_cached = functools.lru_cache(maxsize=1024)(self.__file_idbypath_uncached)
+        # Paths the server reported as missing, FIFO-bounded (dicts keep
+        # insertion order); cleared together with the positive cache
+        self.__neg_paths = {}
+        if requests is not None:
+            self.__session = requests.Session()
+            self.__session.headers['content-type'] = 'application/json'
+            self.__session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        else:
+            # Keep-alive HTTPSConnections, one per thread since
+            # http.client connections are not thread-safe
+            self.__host = urlsplit(self.BASEURL).netloc
+            self.__local = threading.local()
 
-    def log(self, message, level=ODLogLevel.DEBUG):
+    def log(self, fmt, *args, level=ODLogLevel.DEBUG):
         """
         Output Log Message
-        :param message: Log Message
+        :param fmt: Log Message, optionally a %-format string
+        :param args: Values for fmt, only formatted when the level passes
         :param level: Log Level (0 = Error, 1 = Warning, 2 = Info, 3 = Debug)
         """
-        if level <= self.__loglevel:
-            if level == ODLogLevel.ERROR:
-                sys.stderr.write("[ERROR] " + message + os.linesep)
-            elif level == ODLogLevel.WARN:
-                message = "[WARN] " + message
-            elif level == ODLogLevel.INFO:
-                message = "[INFO] " + message
-            else:
-                message = "[DEBUG] " + message
-            sys.stdout.write(message + os.linesep)
+        if level > self.__loglevel:
+            return
+        message = fmt % args if args else fmt
+        stream = sys.stderr if level == ODLogLevel.ERROR else sys.stdout
+        stream.write("".join((_PREFIX[level], message, os.linesep)))
 
-    def __decodejson(self, data):
+    def hash_file(self, fname):
         """
-        Decode a JSON Object
-        :param data: Byte Data
-        :return: JSON Object
+        Hash a local file for an upload
+        :param fname: Filename and -path
+        :return: MD5 Hash
         """
-        strdata = data.decode('utf8')
-        return json.loads(strdata)
+        # The OpenDrive upload API mandates MD5 on the wire
+        return self.__content_hash(fname, "md5")
+
+    def __content_hash(self, fname, algo="md5"):
+        """
+        Generate a content fingerprint of a file
+        :param fname: Filename and -path
+        :param algo: "md5" for the wire format, "blake3" where only a local
+                     fingerprint is needed (falls back to MD5 if the blake3
+                     package is not installed)
+        :return: Hex digest
+        """
+        if algo == "blake3" and blake3 is not None:
+            if os.path.getsize(fname) > (1 << 20):
+                hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            else:
+                hasher = blake3.blake3()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            with open(fname, "rb") as f:
+                while n := f.readinto(buf):
+                    hasher.update(view[:n])
+            return hasher.hexdigest()
+        return self.__md5(fname)
 
     def __md5(self, fname):
         """
@@ -52,24 +155,120 @@ class OpenDriveAPI:
         :param fname: Filename and -path
         :return: MD5 Hash
         """
+        if sys.version_info >= (3, 11):
+            # file_digest reads straight into hashlib's buffer in C and
+            # releases the GIL while hashing
+            with open(fname, "rb") as f:
+                return hashlib.file_digest(f, "md5").hexdigest()
         hash_md5 = md5()
+        buf = bytearray(1 << 20)
+        view = memoryview(buf)
         with open(fname, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
+            while n := f.readinto(buf):
+                hash_md5.update(view[:n])
         return hash_md5.hexdigest()
 
     def __dopost(self, url, postobject):
         """
         Do a Post Request
         :param url: URL to POST to
-        :param postobject: Object to POST (will be encoded as JSON)
+        :param postobject: Object to POST (will be encoded as JSON), or a
+                           pre-encoded JSON body as bytes
         :return: Response Object
         """
-        postdata = json.dumps(postobject).encode('utf8')
+        resp = self.__dosend(url, postobject)
+        if resp.status_code in (401, 403) and self.__session_verified_at is not None:
+            # The cached session verification was stale, drop it and retry
+            # once after re-checking the session against the server
+            self.__session_verified_at = None
+            if self.loggedin():
+                resp = self.__dosend(url, postobject)
+        return resp
 
-        req = urllib.request.Request(url, data=postdata, headers={'content-type': 'application/json'})
-        req.get_method = lambda: 'POST'
-        return urllib.request.urlopen(req)
+    def __checked_post(self, url, body, err_fmt, *args):
+        """
+        POST to an API endpoint with status and transport error handling
+        :param url: Full endpoint URL (one of the _URL_* constants)
+        :param body: Request body (object or pre-encoded bytes)
+        :param err_fmt: %-format string describing the operation for error logs
+        :param args: Values for err_fmt
+        :return: Response Object on HTTP 200, None on any error
+        """
+        try:
+            resp = self.__dopost(url, body)
+        except _TRANSPORT_ERRORS as e:
+            self.log("Error " + err_fmt + ": %s", *args, e, level=ODLogLevel.ERROR)
+            return None
+        if resp.status_code != 200:
+            self.log("Error " + err_fmt + ", got HTTP Status %d: %s", *args, resp.status_code, resp.content, level=ODLogLevel.ERROR)
+            return None
+        return resp
+
+    def __dosend(self, url, postobject):
+        """
+        Send a single POST over the pooled session
+        :param url: URL to POST to
+        :param postobject: Object (encoded as JSON) or pre-encoded bytes
+        :return: Response Object
+        """
+        if requests is None:
+            if not isinstance(postobject, bytes):
+                postobject = json.dumps(postobject).encode('utf8')
+            return self.__fallback_request("POST", url, postobject)
+        if isinstance(postobject, bytes):
+            return self.__session.post(url, data=postobject)
+        return self.__session.post(url, json=postobject)
+
+    def __fallback_request(self, method, url, body=None):
+        """
+        Send a request over a per-thread keep-alive HTTPSConnection
+        :param method: HTTP Method
+        :param url: Full URL below BASEURL
+        :param body: Pre-encoded request body, or None
+        :return: Response Object (status_code/content wrapper)
+
+        Used when the optional requests package is not installed.
+        http.client reuses the connection as long as the server keeps it
+        alive, so this gets the same handshake savings with no dependency.
+        """
+        path = url[url.index(self.__host) + len(self.__host):]
+        conn = getattr(self.__local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(self.__host, timeout=30)
+            self.__local.conn = conn
+        try:
+            conn.request(method, path, body, {"Content-Type": "application/json"})
+            resp = conn.getresponse()
+        except _TRANSPORT_ERRORS:
+            # The server dropped the keep-alive connection, reconnect and
+            # retry once
+            conn.close()
+            conn.request(method, path, body, {"Content-Type": "application/json"})
+            resp = conn.getresponse()
+        return _HTTPResponse(resp.status, resp.read())
+
+    def __session_body(self, extra):
+        """
+        Build a JSON request body from the cached session_id fragment
+        :param extra: Further JSON object members, pre-encoded as bytes
+        :return: Complete JSON body as bytes
+        """
+        return b'{' + self.__session_fragment + b',' + extra + b'}'
+
+    def __do_many(self, func, items):
+        """
+        Run an API call for multiple items in parallel over the pooled session
+        :param func: Bound single-item API method
+        :param items: Items to pass to func, one call each
+        :return: List of results, one per item, in input order
+        """
+        items = list(items)
+        if not items:
+            return []
+        # Verify the session once up front so the workers hit the cached check
+        self.loggedin()
+        with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL) as ex:
+            return list(ex.map(func, items))
 
     def __doget(self, url):
         """
@@ -77,7 +276,9 @@ class OpenDriveAPI:
         :param url: URL to GET
         :return: Response Object
         """
-        return urllib.request.urlopen(url)
+        if requests is None:
+            return self.__fallback_request("GET", url)
+        return self.__session.get(url)
 
     def login(self, username, password):
         """
@@ -87,35 +288,34 @@ class OpenDriveAPI:
         :return: true on successful login, false on error
         """
         if not username or not password:
-            self.log("Username or password not set", ODLogLevel.ERROR)
+            self.log("Username or password not set", level=ODLogLevel.ERROR)
             return False
         if self.__sessionId:
             self.logout()
-        try:
-            self.log("Logging in to OpenDrive with Username " + username, ODLogLevel.DEBUG)
-            resp = self.__dopost(self.BASEURL + "session/login.json", {"username": username, "passwd": password})
-            status = resp.getcode()
-            if status != 200:
-                self.log("Error logging in to OpenDrive, got HTTP Status %d: %s" % (status, resp.read()), ODLogLevel.ERROR)
-                return False
-
-            userinfo = self.__decodejson(resp.read())
-            self.__sessionId = userinfo["SessionID"]
-            return True
-        except urllib.request.HTTPError as e:
-            self.log("Error logging in to OpenDrive, got HTTP Status %d: %s" % (e.code, e.msg), ODLogLevel.ERROR)
+        self.log("Logging in to OpenDrive with Username %s", username, level=ODLogLevel.DEBUG)
+        resp = self.__checked_post(self._URL_LOGIN, {"username": username, "passwd": password}, "logging in to OpenDrive")
+        if resp is None:
             return False
 
+        userinfo = _loads(resp.content)
+        self.__sessionId = userinfo["SessionID"]
+        self.__session_fragment = b'"session_id":' + json.dumps(self.__sessionId).encode()
+        self.__session_verified_at = time.monotonic()
+        self.__idbypath_cached.cache_clear()
+        self.__neg_paths.clear()
+        return True
+
     def logout(self):
         """
         Logout from OpenDrive
         """
         if self.__sessionId:
-            try:
-                self.__dopost(self.BASEURL + "session/logout.json", {"session_id": self.__sessionId})
-            except urllib.request.HTTPError as e:
-                self.log("Error logging out, got HTTP Status %d: %s" % (e.code, e.msg), ODLogLevel.ERROR)
+            self.__checked_post(self._URL_LOGOUT, {"session_id": self.__sessionId}, "logging out")
+            self.__idbypath_cached.cache_clear()
+            self.__neg_paths.clear()
             self.__sessionId = None
+            self.__session_fragment = None
+            self.__session_verified_at = None
 
     def loggedin(self):
         """
@@ -124,19 +324,19 @@ class OpenDriveAPI:
         """
         if not self.__sessionId:
             return False
-        try:
-            resp = self.__dopost(self.BASEURL + "session/exists.json", {"session_id": self.__sessionId})
-            status = resp.getcode()
-            if status != 200:
-                self.log("Error checking session exists, got HTTP Status %d: %s" % (status, resp.read()), ODLogLevel.ERROR)
-                return False
-
-            sessioninfo = self.__decodejson(resp.read())
-            return sessioninfo["result"]
-        except urllib.request.HTTPError as e:
-            self.log("Error checking session exists, got HTTP Status %d: %s" % (e.code, e.msg), ODLogLevel.ERROR)
+        if self.__session_verified_at is not None and time.monotonic() - self.__session_verified_at < self.SESSION_TTL:
+            return True
+        resp = self.__checked_post(self._URL_EXISTS, {"session_id": self.__sessionId}, "checking session exists")
+        if resp is None:
             return False
 
+        sessioninfo = _loads(resp.content)
+        if sessioninfo["result"]:
+            self.__session_verified_at = time.monotonic()
+        else:
+            self.__session_verified_at = None
+        return sessioninfo["result"]
+
     def file_trash(self, fileid):
         """
         Move a file to the trash
@@ -145,17 +345,20 @@ class OpenDriveAPI:
         """
         if not self.loggedin():
             return False
-        try:
-            resp = self.__dopost(self.BASEURL + "file/trash.json", {"session_id": self.__sessionId, "file_id": fileid})
-            status = resp.getcode()
-            if status != 200:
-                self.log("Error deleting file %s, got HTTP Status %d: %s" % (fileid, status, resp.read()), ODLogLevel.ERROR)
-                return False
-
-            return True
-        except urllib.request.HTTPError as e:
-            self.log("Error deleting file %s, got HTTP Status %d: %s" % (fileid, e.code, e.msg), ODLogLevel.ERROR)
+        resp = self.__checked_post(self._URL_TRASH, self.__session_body(b'"file_id":' + json.dumps(fileid).encode()), "deleting file %s", fileid)
+        if resp is None:
             return False
+        self.__idbypath_cached.cache_clear()
+        self.__neg_paths.clear()
+        return True
+
+    def file_trash_many(self, fileids):
+        """
+        Move multiple files to the trash in parallel
+        :param fileids: File IDs to be deleted
+        :return: List of results, one per file id, in input order
+        """
+        return self.__do_many(self.file_trash, fileids)
 
     def file_restore(self, fileid):
         """
@@ -165,17 +368,20 @@ class OpenDriveAPI:
         """
         if not self.loggedin():
             return False
-        try:
-            resp = self.__dopost(self.BASEURL + "file/restore.json", {"session_id": self.__sessionId, "file_id": fileid})
-            status = resp.getcode()
-            if status != 200:
-                self.log("Error restoring file %s from trash, got HTTP Status %d: %s" % (fileid, status, resp.read()), ODLogLevel.ERROR)
-                return False
-
-            return True
-        except urllib.request.HTTPError as e:
-            self.log("Error restoring file %s from trash, got HTTP Status %d: %s" % (fileid, e.code, e.msg), ODLogLevel.ERROR)
+        resp = self.__checked_post(self._URL_RESTORE, self.__session_body(b'"file_id":' + json.dumps(fileid).encode()), "restoring file %s from trash", fileid)
+        if resp is None:
             return False
+        self.__idbypath_cached.cache_clear()
+        self.__neg_paths.clear()
+        return True
+
+    def file_restore_many(self, fileids):
+        """
+        Restore multiple files from the trash in parallel
+        :param fileids: File IDs to be restored
+        :return: List of results, one per file id, in input order
+        """
+        return self.__do_many(self.file_restore, fileids)
 
     def file_sendbyemail(self, fileid, rcpt, subject=None, body=None):
         """
@@ -188,22 +394,13 @@ class OpenDriveAPI:
         """
         if not self.loggedin():
             return False
-        try:
-            req = {"session_id": self.__sessionId, "file_id": fileid, "recipient_emails": rcpt}
-            if subject:
-                req["message_subject"] = subject
-            if body:
-                req["message_body"] = body
-            resp = self.__dopost(self.BASEURL + "file/sendbyemail.json", req)
-            status = resp.getcode()
-            if status != 200:
-                self.log("Error sending file %s to %s, got HTTP Status %d: %s" % (fileid, rcpt, status, resp.read()), ODLogLevel.ERROR)
-                return False
-
-            return True
-        except urllib.request.HTTPError as e:
-            self.log("Error sending file %s to %s, got HTTP Status %d: %s" % (fileid, rcpt, e.code, e.msg), ODLogLevel.ERROR)
-            return False
+        req = {"session_id": self.__sessionId, "file_id": fileid, "recipient_emails": rcpt}
+        if subject:
+            req["message_subject"] = subject
+        if body:
+            req["message_body"] = body
+        resp = self.__checked_post(self._URL_SENDBYEMAIL, req, "sending file %s to %s", fileid, rcpt)
+        return resp is not None
 
     def file_rename(self, fileid, name):
         """
@@ -214,17 +411,12 @@ class OpenDriveAPI:
         """
         if not self.loggedin():
             return False
-        try:
-            resp = self.__dopost(self.BASEURL + "file/rename.json", {"session_id": self.__sessionId, "file_id": fileid, "new_file_name": name})
-            status = resp.getcode()
-            if status != 200:
-                self.log("Error renaming file %s to %s, got HTTP Status %d: %s" % (fileid, name, status, resp.read()), ODLogLevel.ERROR)
-                return False
-
-            return True
-        except urllib.request.HTTPError as e:
-            self.log("Error renaming file %s to %s, got HTTP Status %d: %s" % (fileid, name, e.code, e.msg), ODLogLevel.ERROR)
+        resp = self.__checked_post(self._URL_RENAME, {"session_id": self.__sessionId, "file_id": fileid, "new_file_name": name}, "renaming file %s to %s", fileid, name)
+        if resp is None:
             return False
+        self.__idbypath_cached.cache_clear()
+        self.__neg_paths.clear()
+        return True
 
     def file_movecopy(self, fileid, folderid, move=True, override=False, name=None):
         """
@@ -238,50 +430,79 @@ class OpenDriveAPI:
         """
         if not self.loggedin():
             return False
-        try:
-            req = {"session_id": self.__sessionId, "src_file_id": fileid, "dst_folder_id": folderid}
-            if move:
-                req["move"] = "true"
-            else:
-                req["move"] = "false"
-            if override:
-                req["overwrite_if_exists"] = "true"
-            else:
-                req["overwrite_if_exists"] = "false"
-            if name:
-                req["new_file_name"] = name
-            resp = self.__dopost(self.BASEURL + "file/move_copy.json", req)
-            status = resp.getcode()
-            if status != 200:
-                self.log("Error moving/copying file %s to folder %s, got HTTP Status %d: %s" % (fileid, folderid, status, resp.read()), ODLogLevel.ERROR)
-                return False
-
-            return True
-        except urllib.request.HTTPError as e:
-            self.log("Error moving/copying file %s to folder %s, got HTTP Status %d: %s" % (fileid, folderid, e.code, e.msg), ODLogLevel.ERROR)
+        req = {"session_id": self.__sessionId, "src_file_id": fileid, "dst_folder_id": folderid}
+        if move:
+            req["move"] = "true"
+        else:
+            req["move"] = "false"
+        if override:
+            req["overwrite_if_exists"] = "true"
+        else:
+            req["overwrite_if_exists"] = "false"
+        if name:
+            req["new_file_name"] = name
+        resp = self.__checked_post(self._URL_MOVECOPY, req, "moving/copying file %s to folder %s", fileid, folderid)
+        if resp is None:
             return False
+        self.__idbypath_cached.cache_clear()
+        self.__neg_paths.clear()
+        return True
 
     def file_idbypath(self, path):
         """
         Get a File ID by it's path
         :param path: Path to the file (not starting with /)
         :return: File ID, or None if not found
+
+        Successful lookups are served from a per-session LRU cache and paths
+        the server reported as missing from a bounded negative cache, so
+        repeated resolution of the same path costs no round-trip.
         """
         if not self.loggedin():
             return None
+        if path in self.__neg_paths:
+            return None
         try:
-            resp = self.__dopost(self.BASEURL + "file/idbypath.json", {"session_id": self.__sessionId, "path": path})
-            status = resp.getcode()
-            if status != 200:
-                self.log("Error getting file id by path %s, got HTTP Status %d: %s" % (path, status, resp.read()), ODLogLevel.ERROR)
-                return None
-
-            fileinfo = self.__decodejson(resp.read())
-            return fileinfo["FileId"]
-        except urllib.request.HTTPError as e:
-            self.log("Error getting file id by path %s, got HTTP Status %d: %s" % (path, e.code, e.msg), ODLogLevel.ERROR)
+            return self.__idbypath_cached(path)
+        except FileNotFoundError:
+            if len(self.__neg_paths) >= self.NEG_CACHE_SIZE:
+                del self.__neg_paths[next(iter(self.__neg_paths))]
+            self.__neg_paths[path] = True
+            return None
+        except KeyError:
             return None
 
+    def __file_idbypath_uncached(self, path):
+        """
+        Resolve a path to a File ID against the API
+        :param path: Path to the file (not starting with /)
+        :return: File ID
+        :raises FileNotFoundError: when the server reports the path as missing
+        :raises KeyError: on any other lookup failure, so errors stay uncached
+        """
+        try:
+            resp = self.__dopost(self._URL_IDBYPATH, {"session_id": self.__sessionId, "path": path})
+        except _TRANSPORT_ERRORS as e:
+            self.log("Error getting file id by path %s: %s", path, e, level=ODLogLevel.ERROR)
+            raise KeyError(path)
+        if resp.status_code == 404:
+            # A missing path is an expected probe result, not an error
+            raise FileNotFoundError(path)
+        if resp.status_code != 200:
+            self.log("Error getting file id by path %s, got HTTP Status %d: %s", path, resp.status_code, resp.content, level=ODLogLevel.ERROR)
+            raise KeyError(path)
+
+        fileinfo = _loads(resp.content)
+        return fileinfo["FileId"]
+
+    def file_idbypath_many(self, paths):
+        """
+        Get multiple File IDs by their paths in parallel
+        :param paths: Paths to the files (not starting with /)
+        :return: List of File IDs (or None), one per path, in input order
+        """
+        return self.__do_many(self.file_idbypath, paths)
+
     def file_setaccess(self, fileid, access=ODAccessPerm.PRIVATE):
         """
         Set the Access permissions for a file
@@ -291,14 +512,5 @@ class OpenDriveAPI:
         """
         if not self.loggedin():
             return None
-        try:
-            resp = self.__dopost(self.BASEURL + "file/access.json", {"session_id": self.__sessionId, "file_id": fileid, "file_ispublic": access.value})
-            status = resp.getcode()
-            if status != 200:
-                self.log("Error setting access permissions for file %s to %d, got HTTP Status %d: %s" % (fileid, access.value, status, resp.read()), ODLogLevel.ERROR)
-                return False
-
-            return True
-        except urllib.request.HTTPError as e:
-            self.log("Error setting access permissions for file %s to %d, got HTTP Status %d: %s" % (fileid, access.value, e.code, e.msg), ODLogLevel.ERROR)
-            return False
+        resp = self.__checked_post(self._URL_ACCESS, {"session_id": self.__sessionId, "file_id": fileid, "file_ispublic": access.value}, "setting access permissions for file %s to %d", fileid, access.value)
+        return resp is not None
@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from opendrivecli.opendriveapi import OpenDriveAPI
 
 
@@ -18,29 +19,35 @@ class OpenDriveClient:
         self.__username = username
         self.__password = password
         self.__od = OpenDriveAPI(self.__args.v)
+        self.__hash_future = None
 
     def run(self):
         """
         Run the program
         """
-        self.__od.log("Starting OpenDrive Client", 3)
+        self.__od.log("Starting OpenDrive Client", level=3)
+        # Start hashing the upload file in the background so the disk read
+        # and MD5 overlap with the login round-trip
+        if self.__args.func == "put":
+            self.__hash_future = ThreadPoolExecutor(max_workers=1).submit(self.__od.hash_file, self.__args.local_file)
         # Login
         if not self.__od.login(self.__username, self.__password):
             sys.exit(1)
         # Select Action Handler
-        functions = {
-            "put": self.__put
-        }
-        func = functions.get(self.__args.func, lambda: False)
+        func = getattr(self, "_cmd_" + self.__args.func, None)
+        if func is None:
+            self.__od.log("Unknown command %s", self.__args.func, level=0)
+            self.__od.logout()
+            sys.exit(2)
         success = func()
         # Logout
         self.__od.logout()
         # Exit
         if success:
-            self.__od.log("Action completed successfully", 2)
+            self.__od.log("Action completed successfully", level=2)
             sys.exit(0)
         else:
-            self.__od.log("Action completed with errors", 0)
+            self.__od.log("Action completed with errors", level=0)
             sys.exit(1)
 
     def __login(self):
@@ -55,9 +62,12 @@ class OpenDriveClient:
         :return: ID for Path, return input when its an ID, None on invalid path
         """
 
-    def __put(self):
+    def _cmd_put(self):
         """
         Upload a file
         :return: true on success, false on error
         """
-        self.__od.log("Uploading " + self.__args.local_file + " to " + self.__args.remote_dir)
+        self.__od.log("Uploading %s to %s", self.__args.local_file, self.__args.remote_dir)
+        # Hashing was started before login, collect the result here
+        filehash = self.__hash_future.result()
+        self.__od.log("MD5 of %s is %s", self.__args.local_file, filehash)